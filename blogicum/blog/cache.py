@@ -0,0 +1,32 @@
+from functools import wraps
+
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+
+POST_LIST_CACHE_TIMEOUT = 60
+POST_LIST_CACHE_VERSION_KEY = 'blog:post_list_version'
+
+
+def cache_post_list(view):
+    cached_views = {}
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        version = cache.get_or_set(POST_LIST_CACHE_VERSION_KEY, 1, None)
+        cached_view = cached_views.get(version)
+        if cached_view is None:
+            cached_view = cache_page(
+                POST_LIST_CACHE_TIMEOUT,
+                key_prefix=f'blog.post_list.{version}'
+            )(view)
+            cached_views.clear()
+            cached_views[version] = cached_view
+        return cached_view(request, *args, **kwargs)
+    return wrapper
+
+
+def invalidate_post_list_cache():
+    try:
+        cache.incr(POST_LIST_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(POST_LIST_CACHE_VERSION_KEY, 1, None)
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.16 on 2026-10-15 04:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_pub_date_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_published', 'category', '-pub_date'], name='post_pub_cat_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', 'is_published', '-pub_date'], name='post_cat_pub_date_idx'),
+        ),
+    ]
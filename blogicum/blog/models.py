@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -16,6 +17,18 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class PostManager(models.Manager):
+    def with_related(self):
+        return self.select_related('author', 'location', 'category')
+
+    def published(self):
+        return self.with_related().filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now()
+        )
+
+
 class Post(BaseModel):
     title = models.CharField('Заголовок', max_length=256)
     text = models.TextField('Текст')
@@ -49,10 +62,25 @@ class Post(BaseModel):
     )
     image = models.ImageField('Фото', upload_to='post_images', blank=True)
 
+    objects = PostManager()
+
     class Meta:
         # ordering = ['-pub_date']
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        indexes = [
+            models.Index(
+                fields=['-pub_date', '-id'], name='post_pub_date_id_idx'
+            ),
+            models.Index(
+                fields=['is_published', 'category', '-pub_date'],
+                name='post_pub_cat_date_idx'
+            ),
+            models.Index(
+                fields=['category', 'is_published', '-pub_date'],
+                name='post_cat_pub_date_idx'
+            ),
+        ]
 
 
 class Category(BaseModel):
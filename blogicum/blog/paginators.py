@@ -0,0 +1,94 @@
+from collections.abc import Sequence
+from datetime import timezone
+
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.http import Http404
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_naive
+
+CURSOR_SEPARATOR = '_'
+MAX_CURSOR_PK = 2 ** 63 - 1
+
+
+def encode_cursor(post):
+    return f'{post.pub_date.isoformat()}{CURSOR_SEPARATOR}{post.pk}'
+
+
+def decode_cursor(cursor):
+    pub_date, _, pk = cursor.rpartition(CURSOR_SEPARATOR)
+    try:
+        pub_date = parse_datetime(pub_date)
+        pk = int(pk)
+        if pub_date is None or is_naive(pub_date):
+            raise ValueError
+        if not 0 < pk <= MAX_CURSOR_PK:
+            raise ValueError
+        pub_date = pub_date.astimezone(timezone.utc)
+    except (ValueError, OverflowError):
+        raise Http404('Неверный курсор страницы.')
+    return pub_date, pk
+
+
+class CountedPaginator(Paginator):
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
+
+
+class KeysetPage(Sequence):
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginationMixin:
+    def paginate_queryset(self, queryset, page_size):
+        queryset = queryset.order_by('-pub_date', '-pk')
+        after = self.request.GET.get('after')
+        before = self.request.GET.get('before')
+        if before:
+            pub_date, pk = decode_cursor(before)
+            posts = list(queryset.filter(
+                Q(pub_date__gt=pub_date) | Q(pub_date=pub_date, pk__gt=pk)
+            ).reverse()[:page_size + 1])
+            has_more = len(posts) > page_size
+            posts = posts[:page_size][::-1]
+            page = KeysetPage(
+                posts,
+                next_cursor=encode_cursor(posts[-1]) if posts else None,
+                previous_cursor=encode_cursor(posts[0]) if has_more else None
+            )
+        else:
+            if after:
+                pub_date, pk = decode_cursor(after)
+                queryset = queryset.filter(
+                    Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, pk__lt=pk)
+                )
+            posts = list(queryset[:page_size + 1])
+            has_more = len(posts) > page_size
+            posts = posts[:page_size]
+            page = KeysetPage(
+                posts,
+                next_cursor=encode_cursor(posts[-1]) if has_more else None,
+                previous_cursor=(
+                    encode_cursor(posts[0]) if after and posts else None
+                )
+            )
+        return None, page, page.object_list, page.has_other_pages()
@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_post_list_cache
+from .models import Category, Comment, Location, Post, User
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def reset_post_list_cache(**kwargs):
+    invalidate_post_list_cache()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def reset_post_list_cache_for_author(update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    invalidate_post_list_cache()
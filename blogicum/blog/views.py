@@ -1,17 +1,53 @@
 from django.utils import timezone
 from django.shortcuts import redirect, get_object_or_404
-from django.db.models import Count
-from django.urls import reverse, reverse_lazy
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.views.decorators.vary import vary_on_cookie
 from django.views.generic import (
     DetailView, CreateView, ListView, UpdateView, DeleteView
 )
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
 
+from .cache import cache_post_list
 from .forms import CommentForm, PostForm
 from .models import Post, Category, Comment
+from .paginators import CountedPaginator, KeysetPaginationMixin
 
 MAX_POSTS = 10
+MAX_COMMENTS = 50
+POST_CARD_FIELDS = (
+    'id', 'title', 'text', 'pub_date', 'image', 'is_published',
+    'author__username',
+    'location__name', 'location__is_published',
+    'category__slug', 'category__title', 'category__is_published',
+)
+
+
+def comment_count_subquery():
+    comments = Comment.objects.filter(post=OuterRef('pk'))
+    counts = comments.order_by().values('post')
+    return Coalesce(
+        Subquery(
+            counts.annotate(count=Count('*')).values('count')[:1],
+            output_field=IntegerField()
+        ),
+        0
+    )
+
+
+def comment_url(comment):
+    position = Comment.objects.filter(post_id=comment.post_id).filter(
+        Q(created_at__lt=comment.created_at)
+        | Q(created_at=comment.created_at, id__lt=comment.id)
+    ).count()
+    url = reverse('blog:post_detail', args=[comment.post_id])
+    page = position // MAX_COMMENTS + 1
+    if page > 1:
+        url = f'{url}?comments_page={page}'
+    return f'{url}#comment_{comment.id}'
 
 
 class PostFormMixin:
@@ -21,55 +57,59 @@ class PostFormMixin:
     pk_url_kwarg = 'post_id'
 
     def dispatch(self, request, *args, **kwargs):
-        post = get_object_or_404(Post, pk=self.kwargs['post_id'])
-        if post.author != self.request.user:
+        self.object = get_object_or_404(Post, pk=self.kwargs['post_id'])
+        if self.object.author_id != self.request.user.id:
             return redirect(
                 'blog:post_detail',
                 post_id=self.kwargs['post_id']
             )
         return super().dispatch(request, *args, **kwargs)
 
-
-class PostQuerySet:
-    pk_url_kwarg = 'post_id'
-
-    def get_queryset(self):
-        return Post.objects.select_related(
-            'author', 'location', 'category').filter(
-            is_published=True,
-            category__is_published=True,
-            pub_date__lte=timezone.now()
-        ).order_by('-pub_date').all()
+    def get_object(self, queryset=None):
+        return self.object
 
 
-class PostListView(PostQuerySet, ListView):
+@method_decorator([cache_post_list, vary_on_cookie], name='dispatch')
+class PostListView(KeysetPaginationMixin, ListView):
     paginate_by = MAX_POSTS
     template_name = 'blog/index.html'
 
     def get_queryset(self):
-        queryset = super().get_queryset()
-        return queryset.annotate(comment_count=Count('comments'))
+        return Post.objects.published().only(*POST_CARD_FIELDS).annotate(
+            comment_count=comment_count_subquery())
 
 
-class PostDetailView(LoginRequiredMixin, PostQuerySet, DetailView):
+class PostDetailView(LoginRequiredMixin, DetailView):
     model = Post
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
 
     def get_context_data(self, **kwargs):
-        return dict(
-            **super().get_context_data(**kwargs),
-            form=CommentForm(),
-            comments=self.object.comments.all()
-        )
+        context = super().get_context_data(**kwargs)
+        context['form'] = CommentForm()
+        context['comments'] = CountedPaginator(
+            self.object.comments.select_related('author').order_by(
+                'created_at', 'id'),
+            MAX_COMMENTS,
+            count=self.object.comment_count
+        ).get_page(self.request.GET.get('comments_page'))
+        return context
+
+    def get_queryset(self):
+        return Post.objects.with_related().annotate(
+            comment_count=comment_count_subquery())
 
     def get_object(self, queryset=None):
-        post = get_object_or_404(Post, pk=self.kwargs['post_id'])
-        if self.request.user == post.author:
-            return post
+        visible = Q(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now()
+        )
+        if self.request.user.is_authenticated:
+            visible |= Q(author=self.request.user)
         return get_object_or_404(
-            Post, is_published=True, category__is_published=True,
-            pub_date__lt=timezone.now(), pk=self.kwargs['post_id'])
+            self.get_queryset().filter(visible), pk=self.kwargs['post_id']
+        )
 
 
 class PostCreateView(LoginRequiredMixin, CreateView):
@@ -109,39 +149,40 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         return self.request.user
 
     def get_success_url(self):
-        return reverse_lazy(
+        return reverse(
             'blog:profile',
             kwargs={'username': self.request.user.username}
         )
 
 
-class ProfileListView(PostQuerySet, ListView):
+class ProfileListView(KeysetPaginationMixin, ListView):
     paginate_by = MAX_POSTS
     template_name = 'blog/profile.html'
     model = Post
+    profile = None
 
     def get_object(self):
-        return get_object_or_404(User, username=self.kwargs['username'])
+        if self.profile is None:
+            self.profile = get_object_or_404(
+                User, username=self.kwargs['username']
+            )
+        return self.profile
 
     def get_queryset(self):
-        queryset = Post.objects
-        self.profile = get_object_or_404(User,
-                                         username=self.kwargs['username'])
-
-        queryset = queryset.filter(
-            author=self.profile
-        ).annotate(comment_count=Count('comments')).order_by('-pub_date')
-        if self.request.user != self.profile:
-            queryset = super().get_queryset().annotate(
-                comment_count=Count('comments'))
-
-        return queryset
+        profile = self.get_object()
+        if self.request.user == profile:
+            queryset = Post.objects.with_related()
+        else:
+            queryset = Post.objects.published()
+        return queryset.only(*POST_CARD_FIELDS).filter(
+            author=profile
+        ).annotate(
+            comment_count=comment_count_subquery())
 
     def get_context_data(self, **kwargs):
-        return dict(
-            **super().get_context_data(**kwargs),
-            profile=self.get_object()
-        )
+        context = super().get_context_data(**kwargs)
+        context['profile'] = self.profile
+        return context
 
 
 class CommentMixin(LoginRequiredMixin):
@@ -153,54 +194,61 @@ class CommentMixin(LoginRequiredMixin):
         return reverse('blog:post_detail', args=[self.kwargs['post_id']])
 
     def dispatch(self, request, *args, **kwargs):
-        coment = get_object_or_404(Comment, id=self.kwargs['comment_id'])
-        if coment.author != self.request.user:
+        self.object = get_object_or_404(
+            Comment, id=self.kwargs['comment_id']
+        )
+        if self.object.author_id != self.request.user.id:
             return redirect('blog:post_detail',
                             post_id=self.kwargs['post_id']
                             )
         return super().dispatch(request, *args, **kwargs)
 
+    def get_object(self, queryset=None):
+        return self.object
+
 
 class CommentCreateView(LoginRequiredMixin, CreateView):
     model = Comment
     template_name = 'blog/comment.html'
     form_class = CommentForm
 
-    def get_context_data(self, **kwargs):
-        return dict(**super().get_context_data(**kwargs), form=CommentForm())
-
     def form_valid(self, form):
         form.instance.author = self.request.user
-        form.instance.post = get_object_or_404(Post, pk=self.kwargs['post_id'])
+        form.instance.post = get_object_or_404(
+            Post.objects.only('id'), pk=self.kwargs['post_id']
+        )
         return super().form_valid(form)
 
     def get_success_url(self):
-        return reverse('blog:post_detail', args=[self.kwargs['post_id']])
+        return comment_url(self.object)
 
 
 class CommentUpdateView(CommentMixin, UpdateView):
     form_class = CommentForm
 
+    def get_success_url(self):
+        return comment_url(self.object)
+
 
 class CommentDeleteView(CommentMixin, DeleteView):
     pass
 
 
-class PostCategoryView(PostQuerySet, ListView):
+@method_decorator([cache_post_list, vary_on_cookie], name='dispatch')
+class PostCategoryView(KeysetPaginationMixin, ListView):
     template_name = 'blog/category.html'
     context_object_name = 'post_list'
     paginate_by = MAX_POSTS
     category = None
 
     def get_queryset(self):
-        category_slug = self.kwargs['category_slug']
         self.category = get_object_or_404(
             Category,
             slug=self.kwargs['category_slug'],
             is_published=True
         )
-        return super().get_queryset().filter(
-            category__slug=category_slug
+        return Post.objects.published().only(*POST_CARD_FIELDS).filter(
+            category_id=self.category.id
         )
 
     def get_context_data(self, **kwargs):
@@ -100,6 +100,23 @@ def many_posts_with_published_locations(
     )
 
 
+@pytest.fixture
+def posts_with_equal_pub_dates(
+    mixer: Mixer, user, published_category
+):
+    same_date = datetime.now(tz=pytz.UTC) - timedelta(days=1)
+    pub_dates = [same_date] * 12 + [
+        same_date - timedelta(minutes=minutes) for minutes in range(1, 14)
+    ]
+    return mixer.cycle(len(pub_dates)).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        location=None,
+        pub_date=(pub_date for pub_date in pub_dates),
+    )
+
+
 @pytest.fixture
 def post_comment_context_form_item(
     user_client: Client, post_with_published_location
@@ -0,0 +1,50 @@
+import pytest
+from django.db.models import Model
+from django.test.client import Client
+from mixer.backend.django import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def get_index_content(client: Client) -> str:
+    response = client.get("/")
+    assert response.status_code == 200
+    return response.content.decode("utf-8")
+
+
+def test_index_cache_invalidated(
+    mixer: Mixer,
+    unlogged_client: Client,
+    user: Model,
+    post_with_published_location: Model,
+    django_assert_num_queries,
+):
+    get_index_content(unlogged_client)
+    with django_assert_num_queries(0):
+        get_index_content(unlogged_client)
+
+    new_post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=post_with_published_location.category,
+        location=None,
+    )
+    assert new_post.title in get_index_content(unlogged_client), (
+        "Убедитесь, что кеш главной страницы сбрасывается после"
+        " сохранения публикации."
+    )
+
+    mixer.cycle(2).blend(
+        "blog.Comment", post=post_with_published_location, author=user
+    )
+    assert "(2)" in get_index_content(unlogged_client), (
+        "Убедитесь, что кеш главной страницы сбрасывается после"
+        " сохранения комментария."
+    )
+
+    user.username = f"{user.username}renamed"
+    user.save()
+    assert f"@{user.username}" in get_index_content(unlogged_client), (
+        "Убедитесь, что кеш главной страницы сбрасывается после"
+        " изменения автора."
+    )
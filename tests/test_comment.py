@@ -298,3 +298,43 @@ def test_404_on_comment_deleted_post(
         ),
         assert_created=False,
     )
+
+
+@pytest.mark.django_db
+def test_comment_redirects_to_its_page(
+        mixer,
+        user,
+        user_client: django.test.Client,
+        post_with_published_location: Any,
+        CommentModel: Type[Model],
+):
+    post = post_with_published_location
+    first_comment = mixer.blend(
+        f"blog.{CommentModel.__name__}", post=post, author=user
+    )
+    mixer.cycle(55).blend(f"blog.{CommentModel.__name__}", post=post)
+
+    response = user_client.post(
+        f"/posts/{post.id}/comment/", data={"text": "Последний комментарий"}
+    )
+    new_comment = CommentModel.objects.get(text="Последний комментарий")
+    assert response.status_code == HTTPStatus.FOUND
+    assert response.url == (
+        f"/posts/{post.id}/?comments_page=2#comment_{new_comment.id}"
+    ), (
+        "Убедитесь, что после добавления комментария пользователь попадает"
+        " на страницу комментариев, где виден новый комментарий."
+    )
+    page_content = user_client.get(response.url).content.decode("utf-8")
+    assert f'name="comment_{new_comment.id}"' in page_content
+
+    response = user_client.post(
+        f"/posts/{post.id}/edit_comment/{first_comment.id}/",
+        data={"text": "Исправленный комментарий"},
+    )
+    assert response.url == (
+        f"/posts/{post.id}/#comment_{first_comment.id}"
+    ), (
+        "Убедитесь, что после редактирования комментария пользователь"
+        " попадает на страницу комментариев, где виден этот комментарий."
+    )
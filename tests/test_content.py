@@ -405,6 +405,23 @@ class TestContent:
             ), ("Убедитесь, что на странице пользователя "
                 "не отображаются публикации других авторов.")
 
+    def test_only_author_pubs_in_profile_for_visitor(
+            self, mixer, user, post_with_published_location,
+            post_of_another_author
+    ):
+        mixer.blend(
+            "blog.Post",
+            author=user,
+            category=post_with_published_location.category,
+            is_published=False,
+        )
+        response = self.profile_tester.another_client_testget()
+        context_posts = response.context.get(self.profile_tester.items_key)
+        assert [post.id for post in context_posts] == [
+            post_with_published_location.id
+        ], ("Убедитесь, что посетитель чужой страницы пользователя видит"
+            " только опубликованные публикации этого автора.")
+
     def test_unpublished_category(
         self, user_client, posts_with_unpublished_category
     ):
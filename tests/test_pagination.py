@@ -0,0 +1,84 @@
+from typing import List
+
+import pytest
+from django.db.models import Model
+from django.test.client import Client
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+def get_page(client: Client, **params):
+    response = client.get("/", params)
+    assert response.status_code == 200, (
+        "Убедитесь, что страница ленты с курсором пагинации загружается"
+        " без ошибок."
+    )
+    return response.context["page_obj"]
+
+
+def walk_forward(client: Client) -> list:
+    pages = [get_page(client)]
+    while pages[-1].has_next():
+        pages.append(get_page(client, after=pages[-1].next_cursor))
+    return pages
+
+
+def test_keyset_pagination_walks_both_ways(
+    user_client: Client, posts_with_equal_pub_dates: List[Model]
+):
+    expected_ids = [
+        post.id for post in sorted(
+            posts_with_equal_pub_dates,
+            key=lambda post: (post.pub_date, post.id),
+            reverse=True,
+        )
+    ]
+
+    forward_pages = walk_forward(user_client)
+    forward_ids = [[post.id for post in page] for page in forward_pages]
+    assert sum(forward_ids, []) == expected_ids, (
+        "Убедитесь, что при переходе по страницам вперёд публикации"
+        " не пропускаются и не повторяются, в том числе при одинаковой"
+        " дате публикации."
+    )
+    assert all(len(ids) <= N_PER_PAGE for ids in forward_ids)
+    assert not forward_pages[0].has_previous(), (
+        "Убедитесь, что у первой страницы нет ссылки на предыдущую."
+    )
+    assert not forward_pages[-1].has_next(), (
+        "Убедитесь, что у последней страницы нет ссылки на следующую."
+    )
+
+    backward_ids = [forward_ids[-1]]
+    page = forward_pages[-1]
+    while page.has_previous():
+        page = get_page(user_client, before=page.previous_cursor)
+        backward_ids.append([post.id for post in page])
+    assert backward_ids[::-1] == forward_ids, (
+        "Убедитесь, что при переходе по страницам назад возвращаются те же"
+        " страницы, что и при переходе вперёд."
+    )
+    assert not page.has_previous()
+
+
+@pytest.mark.parametrize(
+    "params",
+    (
+        {"after": "garbage"},
+        {"after": "2020-01-01T00:00:00+00:00_abc"},
+        {"after": "2020-01-01T00:00:00+00:00_0"},
+        {"after": "2020-01-01T00:00:00+00:00_" + "9" * 30},
+        {"after": "0001-01-01T00:00:00+05:00_1"},
+        {"before": "9999-12-31T23:59:59-05:00_1"},
+        {"after": "2020-01-01T00:00:00_1"},
+        {"before": "2020-13-01T00:00:00+00:00_1"},
+    ),
+)
+def test_keyset_pagination_malformed_cursor(user_client: Client, params):
+    response = user_client.get("/", params)
+    assert response.status_code == 404, (
+        "Убедитесь, что при неверном курсоре пагинации возвращается"
+        " статус 404."
+    )